@@ -1,30 +1,79 @@
 import os
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 from dotenv import find_dotenv, load_dotenv
 
 env_file_path = find_dotenv()
 load_dotenv(env_file_path)
 
+# Sent with every HTTP request the package makes.
+USER_AGENT = "termux-monitor"
 
-class Conifg:
-    ENV = os.getenv("ENV", "production")
+# Each config is an immutable NamedTuple instance built once from the environment.
 
 
-class WifiConfig:
-    DELAY = int(os.getenv("WIFI_RESTART_DELAY", 5))
+class _Conifg(NamedTuple):
+    ENV: str
 
 
-class GetCountryConfig:
-    MAX_RETRIES = int(os.getenv("GET_COUNTRY_MAX_RETRIES", 3))
-    TIMEOUT = int(os.getenv("GET_COUNTRY_TIMEOUT", 30))
-    URL = os.getenv("GET_COUNTRY_URL", "https://ipinfo.io/json")
+Conifg = _Conifg(
+    ENV=os.getenv("ENV", "production"),
+)
 
 
-class TelephonyConfig:
-    TARGET_OPERATOR_NAME = os.getenv("TARGET_OPERATOR_NAME", "IND airtel")
+class _WifiConfig(NamedTuple):
+    DELAY: int
+    COMMAND_TIMEOUT: int
 
 
-class LoggingConfig:
-    TELEGRAM_LOGGING_LEVEL = os.getenv("TELEGRAM_LOGGING_LEVEL", "INFO")
-    TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-    TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+WifiConfig = _WifiConfig(
+    DELAY=int(os.getenv("WIFI_RESTART_DELAY", 5)),
+    COMMAND_TIMEOUT=int(os.getenv("WIFI_COMMAND_TIMEOUT", 10)),
+)
+
+
+class _GetCountryConfig(NamedTuple):
+    MAX_RETRIES: int
+    TIMEOUT: int
+    URL: str
+    CACHE_TTL: int
+    CACHE_PATH: Path
+
+
+GetCountryConfig = _GetCountryConfig(
+    MAX_RETRIES=int(os.getenv("GET_COUNTRY_MAX_RETRIES", 3)),
+    TIMEOUT=int(os.getenv("GET_COUNTRY_TIMEOUT", 30)),
+    URL=os.getenv("GET_COUNTRY_URL", "https://ipinfo.io/json"),
+    CACHE_TTL=int(os.getenv("GET_COUNTRY_CACHE_TTL", 300)),
+    CACHE_PATH=Path(
+        os.getenv(
+            "GET_COUNTRY_CACHE_PATH", Path.home() / ".termux-monitor-geocache.json"
+        )
+    ),
+)
+
+
+class _TelephonyConfig(NamedTuple):
+    TARGET_OPERATOR_NAME: str
+
+
+TelephonyConfig = _TelephonyConfig(
+    TARGET_OPERATOR_NAME=sys.intern(os.getenv("TARGET_OPERATOR_NAME", "IND airtel")),
+)
+
+
+class _LoggingConfig(NamedTuple):
+    TELEGRAM_LOGGING_LEVEL: str
+    TELEGRAM_BOT_TOKEN: Optional[str]
+    TELEGRAM_CHAT_ID: Optional[str]
+    TELEGRAM_TIMEOUT: int
+
+
+LoggingConfig = _LoggingConfig(
+    TELEGRAM_LOGGING_LEVEL=os.getenv("TELEGRAM_LOGGING_LEVEL", "INFO"),
+    TELEGRAM_BOT_TOKEN=os.getenv("TELEGRAM_BOT_TOKEN"),
+    TELEGRAM_CHAT_ID=os.getenv("TELEGRAM_CHAT_ID"),
+    TELEGRAM_TIMEOUT=int(os.getenv("TELEGRAM_TIMEOUT", 10)),
+)
@@ -1,61 +1,133 @@
-import json
+import asyncio
+import contextlib
+import os
+import random
+import re
+import socket
 import subprocess
+import tempfile
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import requests
-from requests.exceptions import ConnectionError, RequestException, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 
-from .config import GetCountryConfig, TelephonyConfig, WifiConfig
-from .tglogging import LoggerFactory
+from .config import USER_AGENT, GetCountryConfig, TelephonyConfig, WifiConfig
+from .tglogging import get_logger
 
-logger = LoggerFactory.get_logger("termux_monitor.core")
+logger = get_logger("termux_monitor.core")
 
+# Reuse connections across lookups; get_country does its own retrying.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+)
+_SESSION.headers.update({"User-Agent": USER_AGENT, "Accept": "application/json"})
 
-def is_internet_connected(host="8.8.8.8", timeout=3):
+_PHONE_PACKAGE_NAME = "com.android.phone"
+_NETWORK_DOWN_RE = re.compile(r"no service|unavailable", re.IGNORECASE)
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Country lookups keyed by URL, loaded lazily from GetCountryConfig.CACHE_PATH.
+_country_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def is_internet_connected(host="8.8.8.8", port=53, timeout=3) -> bool:
+    """
+    Checks internet connectivity by opening a TCP connection to the given host.
+
+    Args:
+        host (str): Host to connect to. Defaults to 8.8.8.8.
+        port (int): Port to connect to. Defaults to 53 (DNS).
+        timeout (int): Connection timeout in seconds. Defaults to 3.
+
+    Returns:
+        bool: True if the connection succeeds, False otherwise.
+    """
     try:
-        subprocess.run(
-            ["ping", "-c", "1", "-W", str(timeout), host],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-        return True
-    except subprocess.CalledProcessError:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
         return False
 
 
-def restart_wifi(delay=WifiConfig.DELAY) -> bool:
+def restart_wifi(
+    delay=WifiConfig.DELAY, command_timeout=WifiConfig.COMMAND_TIMEOUT
+) -> bool:
     """
     Restart the Wi-Fi connection.
 
     Args:
         delay (int): The delay in seconds before re-enabling the Wi-Fi connection. Defaults to WifiConfig.DELAY.
+        command_timeout (int): Timeout in seconds for each termux-wifi-enable call. Defaults to WifiConfig.COMMAND_TIMEOUT.
 
     Returns:
         bool: True if the Wi-Fi connection is successfully restarted, False otherwise.
     """
     try:
-        subprocess.run(["termux-wifi-enable", "false"], check=True)
+        subprocess.run(
+            ["termux-wifi-enable", "false"], check=True, timeout=command_timeout
+        )
         time.sleep(delay)
-        subprocess.run(["termux-wifi-enable", "true"], check=True)
+        subprocess.run(
+            ["termux-wifi-enable", "true"], check=True, timeout=command_timeout
+        )
         return True
     except subprocess.CalledProcessError as e:
-        error_message = f"Error restarting Wi-Fi: {e}"
-        logger.exception(error_message)
+        logger.exception("Error restarting Wi-Fi: %s", e)
         return False
     except subprocess.TimeoutExpired as e:
-        error_message = f"Timeout expired while restarting Wi-Fi: {e}"
-        logger.exception(error_message)
+        logger.exception("Timeout expired while restarting Wi-Fi: %s", e)
         return False
 
 
+def _load_country_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the country cache from GetCountryConfig.CACHE_PATH on first use.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Cached entries of the form {"country": ..., "ts": ...} keyed by URL.
+    """
+    global _country_cache
+    if _country_cache is None:
+        try:
+            with open(GetCountryConfig.CACHE_PATH, "rb") as f:
+                _country_cache = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            _country_cache = {}
+        if not isinstance(_country_cache, dict):
+            _country_cache = {}
+    return _country_cache
+
+
+def _save_country_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Atomically writes the country cache to GetCountryConfig.CACHE_PATH.
+    """
+    path = GetCountryConfig.CACHE_PATH
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(cache))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write country cache: %s", e)
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
 def get_country(
     max_retries=GetCountryConfig.MAX_RETRIES,
     timeout=GetCountryConfig.TIMEOUT,
     url=GetCountryConfig.URL,
     backoff_factor=1,  # initial backoff delay in seconds
     max_backoff=32,  # maximum backoff delay in seconds
+    jitter=1,  # maximum random delay added to each backoff in seconds
+    cache_ttl=GetCountryConfig.CACHE_TTL,
 ) -> Optional[str]:
     """
     Retrieves the country based on the IP address.
@@ -66,43 +138,72 @@ def get_country(
         url (str): URL for the API request. Defaults to GetCountryConfig.URL.
         backoff_factor (int): Initial backoff delay in seconds. Defaults to 1.
         max_backoff (int): Maximum backoff delay in seconds. Defaults to 32.
+        jitter (float): Maximum random delay in seconds added to each backoff. Defaults to 1.
+        cache_ttl (int): Seconds a cached country stays valid. Defaults to GetCountryConfig.CACHE_TTL.
+            A VPN switched on within this window goes unnoticed until the entry expires.
 
     Returns:
         str: The country name if retrieved successfully, otherwise None.
     """
 
+    # Checked before the cache so that being offline still reads as "no country"
+    # to check_and_restart_wifi rather than as the last cached answer.
     if not is_internet_connected():
         return None
 
+    cache = _load_country_cache()
+    cached = cache.get(url)
+    # Anything but a well-formed entry counts as a miss, so a hand-edited or
+    # corrupted cache file can't make get_country raise.
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("ts"), (int, float))
+        and time.time() - cached["ts"] < cache_ttl
+    ):
+        return cached.get("country")
+
     retry_count = 0
     backoff_delay = backoff_factor
 
     while retry_count < max_retries:
         try:
-            response = requests.get(url, timeout=timeout)
+            response = _SESSION.get(url, timeout=timeout)
             response.raise_for_status()  # Raises an HTTPError if the HTTP request returned an unsuccessful status code
-            data = response.json()
+            data = orjson.loads(response.content)
             country = data.get("country")
+            if country:
+                cache[url] = {"country": country, "ts": time.time()}
+                _save_country_cache(cache)
             return country
         except (Timeout, ConnectionError) as e:
             # Network errors, retry with backoff
-            logger.warning(f"Network error: {e}")
-            time.sleep(backoff_delay)
-            backoff_delay = min(backoff_delay * 2, max_backoff)
-            retry_count += 1
+            logger.warning("Network error: %s", e)
+        except HTTPError as e:
+            if (
+                e.response is None
+                or e.response.status_code not in _RETRYABLE_STATUS_CODES
+            ):
+                logger.exception("HTTP error: %s", e)
+                return None
+            # Rate limited or server error, retry with backoff
+            logger.warning("HTTP error: %s", e)
         except RequestException as e:
             # Other request errors, log and return None
-            logger.exception(f"Request error: {e}")
+            logger.exception("Request error: %s", e)
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # JSON decoding error, log and return None
-            logger.exception(f"JSON decoding error: {e}")
+            logger.exception("JSON decoding error: %s", e)
             return None
         except Exception as e:
             # Unexpected error, log and return None
-            logger.exception(f"Unexpected error: {e}")
+            logger.exception("Unexpected error: %s", e)
             return None
 
+        time.sleep(backoff_delay + random.uniform(0, jitter))
+        backoff_delay = min(backoff_delay * 2, max_backoff)
+        retry_count += 1
+
     # Max retries exceeded, return None
     logger.error("Max retries exceeded")
     return None
@@ -114,15 +215,15 @@ def get_telephony_device_info() -> Optional[Dict[str, str]]:
     """
     try:
         result = subprocess.run(
-            ["termux-telephony-deviceinfo"], check=True, capture_output=True, text=True
+            ["termux-telephony-deviceinfo"], check=True, capture_output=True
         )
-        device_info = json.loads(result.stdout)
+        device_info = orjson.loads(result.stdout)
         return device_info
     except subprocess.CalledProcessError as e:
-        logger.exception(f"Error executing command: {e}")
+        logger.exception("Error executing command: %s", e)
         return None
-    except json.JSONDecodeError as e:
-        logger.exception(f"Error decoding JSON: {e}")
+    except orjson.JSONDecodeError as e:
+        logger.exception("Error decoding JSON: %s", e)
         return None
 
 
@@ -146,15 +247,18 @@ def get_notifications() -> Optional[List[Dict[str, str]]]:
     """
     try:
         result = subprocess.run(
-            ["termux-notification-list"], capture_output=True, text=True
+            ["termux-notification-list"], check=True, capture_output=True
         )
-        notifications = json.loads(result.stdout)
+        notifications = orjson.loads(result.stdout)
         return notifications
-    except json.JSONDecodeError as e:
-        logger.exception(f"Error decoding JSON: {e}")
+    except subprocess.CalledProcessError as e:
+        logger.exception("Error executing command: %s", e)
+        return None
+    except orjson.JSONDecodeError as e:
+        logger.exception("Error decoding JSON: %s", e)
         return None
     except Exception as e:
-        logger.exception(f"Error retrieving notifications: {e}")
+        logger.exception("Error retrieving notifications: %s", e)
         return None
 
 
@@ -171,44 +275,58 @@ def is_network_up(notifications: List[Dict[str, str]]) -> bool:
             "no service" or "unavailable", False otherwise.
     """
     for notification in notifications:
-        if notification.get("packageName") == "com.android.phone":
-            content = notification.get("content", "").lower()
-            if "no service" in content or "unavailable" in content:
+        if notification.get("packageName") == _PHONE_PACKAGE_NAME:
+            if _NETWORK_DOWN_RE.search(notification.get("content", "")):
                 logger.info(notification)
                 return False
 
     return True
 
 
+async def _gather_device_state() -> Tuple[
+    Optional[Dict[str, str]], Optional[List[Dict[str, str]]]
+]:
+    """
+    Runs get_telephony_device_info and get_notifications concurrently.
+
+    Returns:
+        Tuple: The device info and the notifications, as returned by each helper.
+    """
+    loop = asyncio.get_running_loop()
+    device_info, notifications = await asyncio.gather(
+        loop.run_in_executor(None, get_telephony_device_info),
+        loop.run_in_executor(None, get_notifications),
+    )
+    return device_info, notifications
+
+
 def check_and_restart_wifi() -> bool:
-    device_info = get_telephony_device_info()
+    device_info, notifications = asyncio.run(_gather_device_state())
     if not device_info:
         logger.error("Failed to retrieve device info.")
         return False
 
-    notifications = get_notifications()
-
-    if not (
+    # Without notifications there is nothing suggesting the network is down.
+    if not notifications or (
         is_network_operator_name_as_desired(device_info)
         and is_network_up(notifications)
-        if notifications
-        else True
     ):
-        country = get_country()
-        if not country:
-            logger.critical("Failed to retrieve country. Possibly internet is down.")
-            return False
-        if country == "IN":
-            logger.info(
-                f"Network operator is not {TelephonyConfig.TARGET_OPERATOR_NAME} but country is 'IN'. Restarting Wi-Fi."
-            )
-            return restart_wifi()
-        else:
-            logger.critical("Country is not 'IN'. Please check VPN Connection.")
-            return False
-
-    else:
         logger.debug(
-            f"Network operator is {TelephonyConfig.TARGET_OPERATOR_NAME}. No action needed."
+            "Network operator is %s. No action needed.",
+            TelephonyConfig.TARGET_OPERATOR_NAME,
         )
         return False
+
+    country = get_country()
+    if not country:
+        logger.critical("Failed to retrieve country. Possibly internet is down.")
+        return False
+    if country == "IN":
+        logger.info(
+            "Network operator is not %s but country is 'IN'. Restarting Wi-Fi.",
+            TelephonyConfig.TARGET_OPERATOR_NAME,
+        )
+        return restart_wifi()
+    else:
+        logger.critical("Country is not 'IN'. Please check VPN Connection.")
+        return False
@@ -1,11 +1,16 @@
+import functools
 import logging
 import logging.config
+import queue
+import threading
+from logging.handlers import QueueHandler
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from .config import Conifg, LoggingConfig
+from .config import USER_AGENT, Conifg, LoggingConfig
 
 # Define custom logging levels with emojis
 DEBUG_EMOJI = "🐛🔍"
@@ -14,12 +19,21 @@ WARNING_EMOJI = "⚠️"
 ERROR_EMOJI = "❌"
 CRITICAL_EMOJI = "🚨"
 
+# Telegram rejects messages longer than this many characters.
+MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n---\n\n"
+
 DEFAULT_LOG_PATH = (
     Path("app.log")
     if Conifg.ENV == "development"
     else Path.home() / "termux-monitor.log"
 )
 
+# Keep the connection to the Telegram API alive between messages.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+
 
 class CustomFormatter(logging.Formatter):
     def format(self, record):
@@ -49,6 +63,14 @@ class CustomFormatter(logging.Formatter):
 
 
 class TelegramHandler(logging.Handler):
+    EMOJIS = {
+        "DEBUG": DEBUG_EMOJI,
+        "INFO": INFO_EMOJI,
+        "WARNING": WARNING_EMOJI,
+        "ERROR": ERROR_EMOJI,
+        "CRITICAL": CRITICAL_EMOJI,
+    }
+
     def __init__(
         self, bot_token: Optional[str], chat_id: Optional[str], level=logging.NOTSET
     ):
@@ -62,28 +84,45 @@ class TelegramHandler(logging.Handler):
         )
 
     def emit(self, record):
-        func_name = getattr(record, "funcName", "")
-        if func_name in ("<module>", ""):
-            setattr(record, "funcName", record.module)
+        self.send_telegram_message(self.format_record(record))
+
+    def emit_batch(self, records):
+        """
+        Sends the records joined into as few messages as Telegram's length limit allows.
+
+        Args:
+            records (List[logging.LogRecord]): Records to send, oldest first.
+        """
+        batch = ""
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                message = self.format_record(record)
+            except Exception:
+                self.handleError(record)
+                continue
+            if not batch:
+                batch = message
+            elif len(batch) + len(BATCH_SEPARATOR) + len(message) > MAX_MESSAGE_LENGTH:
+                self.send_telegram_message(batch)
+                batch = message
+            else:
+                batch = f"{batch}{BATCH_SEPARATOR}{message}"
+        if batch:
+            self.send_telegram_message(batch)
+
+    def format_record(self, record):
+        if record.funcName in ("<module>", ""):
+            record.funcName = record.module
         if record.exc_text:
             formatted_record = self.error_formatter.format(record)
         else:
             formatted_record = self.format(record)
-        # log_entry = self.format(record)
-        emoji_log_entry = self.prefix_message_with_emoji(
-            record.levelname, formatted_record
-        )
-        self.send_telegram_message(emoji_log_entry)
+        return self.prefix_message_with_emoji(record.levelname, formatted_record)
 
     def prefix_message_with_emoji(self, levelname, message):
-        emoji = {
-            "DEBUG": DEBUG_EMOJI,
-            "INFO": INFO_EMOJI,
-            "WARNING": WARNING_EMOJI,
-            "ERROR": ERROR_EMOJI,
-            "CRITICAL": CRITICAL_EMOJI,
-        }.get(levelname, "")
-        return f"{emoji} {message}"
+        return f"{self.EMOJIS.get(levelname, '')} {message}"
 
     def send_telegram_message(self, message):
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
@@ -94,77 +133,165 @@ class TelegramHandler(logging.Handler):
             "disable_web_page_preview": True,
         }
         try:
-            requests.post(url, data=payload)
+            # Bounded so a stalled connection can't hang logging.shutdown() at exit.
+            _SESSION.post(url, data=payload, timeout=LoggingConfig.TELEGRAM_TIMEOUT)
         except Exception as e:
             print(f"Failed to send log to Telegram: {e}")
 
 
-class LoggerFactory:
-    _LOG = None
+class TelegramQueueListener:
+    """
+    Sends queued records to a TelegramHandler from a background thread.
 
-    @staticmethod
-    def __createlogger(name: str):
-        """
-        A private method that interacts with the python logging module.
-        """
+    The thread blocks until a record arrives, then drains whatever else is already
+    queued without waiting, so a burst goes out as one message and a lone record is
+    sent right away.
+    """
+
+    _sentinel = None
+
+    def __init__(self, queue, handler: TelegramHandler):
+        self.queue = queue
+        self.handler = handler
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        # Sends everything queued before the sentinel, then waits for the thread.
+        self.queue.put_nowait(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not self._sentinel:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = batch[-1] is self._sentinel
+            records = batch[:-1] if stopping else batch
+            if records:
+                self.handler.emit_batch(records)
+            for _ in batch:
+                self.queue.task_done()
+            if stopping:
+                return
+
+
+class TelegramQueueHandler(QueueHandler):
+    """
+    Queues records for a TelegramHandler that sends them from a background thread,
+    so logging calls don't wait on the Telegram API.
+    """
 
-        # Define a basic logging configuration programmatically
-        logging_config = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "standard": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                },
-                "telegram": {
-                    "format": "<b>%(levelname)s</b>\n<em>🧩 %(name)s.%(funcName)s</em>\n\n<code>%(message)s</code>\n\n🕒 <code>%(asctime)s</code>"
-                },
+    def __init__(
+        self,
+        bot_token: Optional[str],
+        chat_id: Optional[str],
+        level=logging.NOTSET,
+    ):
+        # Built first: it rejects missing credentials, and raising after
+        # Handler.__init__ would leave a half-built handler for logging.shutdown().
+        self.telegram_handler = TelegramHandler(bot_token, chat_id)
+        super().__init__(queue.Queue(-1))
+        self.setLevel(level)
+        self.listener = TelegramQueueListener(self.queue, self.telegram_handler)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # Records are formatted on the listener thread by the Telegram handler.
+        self.telegram_handler.setFormatter(fmt)
+
+    def prepare(self, record):
+        # The record never leaves the process, so keep it intact instead of
+        # flattening it; TelegramHandler needs exc_text for its error format.
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        return record
+
+    def close(self):
+        # Called by logging.shutdown() at exit; drains the queue before returning.
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+        super().close()
+
+
+_CONFIGURED = False
+
+
+def _ensure_configured():
+    """
+    Configures the python logging module once per process.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
+    # Define a basic logging configuration programmatically
+    logging_config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "standard": {
+                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "level": "DEBUG",
-                    "formatter": "standard",
-                    "stream": "ext://sys.stdout",
-                },
-                "file": {
-                    "class": "logging.FileHandler",
-                    "level": "DEBUG",
-                    "formatter": "standard",
-                    "filename": DEFAULT_LOG_PATH,
-                },
-                "telegram": {
-                    "()": TelegramHandler,
-                    "level": LoggingConfig.TELEGRAM_LOGGING_LEVEL,
-                    "formatter": "telegram",
-                    "bot_token": LoggingConfig.TELEGRAM_BOT_TOKEN,
-                    "chat_id": LoggingConfig.TELEGRAM_CHAT_ID,
-                },
+            "telegram": {
+                "format": "<b>%(levelname)s</b>\n<em>🧩 %(name)s.%(funcName)s</em>\n\n<code>%(message)s</code>\n\n🕒 <code>%(asctime)s</code>"
             },
-            "loggers": {
-                "": {  # root logger
-                    "level": "DEBUG",
-                    "handlers": ["console", "file", "telegram"],
-                },
-                "urllib3": {  # Suppress urllib3 debug logs
-                    "handlers": ["console"],
-                    "level": "WARNING",
-                },
+        },
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "level": "DEBUG",
+                "formatter": "standard",
+                "stream": "ext://sys.stdout",
             },
-        }
+            "file": {
+                "class": "logging.FileHandler",
+                "level": "DEBUG",
+                "formatter": "standard",
+                "filename": DEFAULT_LOG_PATH,
+            },
+            "telegram": {
+                "()": TelegramQueueHandler,
+                "level": LoggingConfig.TELEGRAM_LOGGING_LEVEL,
+                "formatter": "telegram",
+                "bot_token": LoggingConfig.TELEGRAM_BOT_TOKEN,
+                "chat_id": LoggingConfig.TELEGRAM_CHAT_ID,
+            },
+        },
+        "loggers": {
+            "": {  # root logger
+                "level": "DEBUG",
+                "handlers": ["console", "file", "telegram"],
+            },
+            "urllib3": {  # Suppress urllib3 debug logs
+                "handlers": ["console"],
+                "level": "WARNING",
+            },
+            "asyncio": {  # Suppress the per-run "Using selector" debug log
+                "level": "WARNING",
+            },
+        },
+    }
 
-        logging.config.dictConfig(logging_config)
-        LoggerFactory._LOG = logging.getLogger(name)
+    logging.config.dictConfig(logging_config)
+    _CONFIGURED = True
 
-        return LoggerFactory._LOG
 
-    @staticmethod
-    def get_logger(name: str):
-        """
-        A static method called by other modules to initialize logger in their own modules.
+@functools.lru_cache(maxsize=None)
+def get_logger(name: str) -> logging.Logger:
+    """
+    Called by other modules to initialize logger in their own modules.
 
-        Args:
-            name (str): Name of the logger.
-        """
-        logger = LoggerFactory.__createlogger(name)
-        return logger
+    Args:
+        name (str): Name of the logger.
+    """
+    _ensure_configured()
+    return logging.getLogger(name)
@@ -0,0 +1,54 @@
+import logging
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Output capture is disabled (see pyproject.toml), so keep the stand-in logger
+# from falling back to logging.lastResort and printing to stderr.
+_test_logger = logging.getLogger("test")
+_test_logger.addHandler(logging.NullHandler())
+
+_logger_patcher = patch(
+    "src.termux_monitor.tglogging.get_logger",
+    return_value=_test_logger,
+)
+
+
+def pytest_configure(config):
+    # Swap the module loggers for a quiet one before any test module imports core,
+    # so importing it doesn't configure the console, file and Telegram handlers.
+    _logger_patcher.start()
+
+
+def pytest_unconfigure(config):
+    _logger_patcher.stop()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def no_sleep():
+    """
+    Makes time.sleep a no-op for the whole session; no test wants to really wait.
+    Tests that count sleeps can still monkeypatch their own mock over it.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "sleep", lambda *args, **kwargs: None)
+        yield
+
+
+@pytest.fixture(scope="class")
+def _subprocess_run_mock():
+    return MagicMock(spec=subprocess.run)
+
+
+@pytest.fixture
+def mock_subprocess_run(_subprocess_run_mock, monkeypatch):
+    """
+    Replaces subprocess.run for the duration of a test with a MagicMock specced on it.
+    The mock is built once per test class and fully reset, including its return
+    value and side effect, before each test.
+    """
+    _subprocess_run_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(subprocess, "run", _subprocess_run_mock)
+    return _subprocess_run_mock
@@ -0,0 +1,340 @@
+import json
+import os
+import socket
+import subprocess
+import time
+from unittest.mock import MagicMock, call
+
+import pytest
+from requests.exceptions import HTTPError, RequestException, Timeout
+
+from src.termux_monitor.config import GetCountryConfig, TelephonyConfig, WifiConfig
+from src.termux_monitor.core import (
+    check_and_restart_wifi,
+    get_country,
+    get_notifications,
+    get_telephony_device_info,
+    is_internet_connected,
+    restart_wifi,
+)
+
+pytestmark = pytest.mark.slow
+
+# Exception instances are reusable as side_effect values, so build them once.
+_CALLED_PROCESS_ERROR = subprocess.CalledProcessError(1, "cmd")
+_TIMEOUT_EXPIRED = subprocess.TimeoutExpired("cmd", timeout=1)
+
+_DESIRED_OPERATOR_STDOUT = json.dumps(
+    {"network_operator_name": "Desired Operator"}
+).encode()
+
+_URL = GetCountryConfig.URL
+_TIMEOUT = GetCountryConfig.TIMEOUT
+_MAX_RETRIES = GetCountryConfig.MAX_RETRIES
+
+_WIFI_RESTART_CALLS = [
+    call(
+        ["termux-wifi-enable", "false"], check=True, timeout=WifiConfig.COMMAND_TIMEOUT
+    ),
+    call(
+        ["termux-wifi-enable", "true"], check=True, timeout=WifiConfig.COMMAND_TIMEOUT
+    ),
+]
+
+
+class TestRestartWifi:
+    def test_wifi_restarts_successfully(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = [None, None]
+        result = restart_wifi()
+        assert mock_subprocess_run.call_args_list == _WIFI_RESTART_CALLS
+        assert result
+
+    def test_wifi_disable_raises_error(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = [_CALLED_PROCESS_ERROR]
+        result = restart_wifi()
+        assert mock_subprocess_run.call_args_list == _WIFI_RESTART_CALLS[:1]
+        assert not result
+
+    def test_wifi_enable_raises_error(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = [None, _CALLED_PROCESS_ERROR]
+        result = restart_wifi()
+        assert mock_subprocess_run.call_args_list == _WIFI_RESTART_CALLS
+        assert not result
+
+    def test_wifi_enable_raises_timeout_error(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = [None, _TIMEOUT_EXPIRED]
+        result = restart_wifi()
+        assert mock_subprocess_run.call_args_list == _WIFI_RESTART_CALLS
+        assert not result
+
+
+class TestIsInternetConnected:
+    def test_connected(self, monkeypatch):
+        mock_connect = MagicMock()
+        monkeypatch.setattr(socket, "create_connection", mock_connect)
+        assert is_internet_connected()
+        mock_connect.assert_called_once_with(("8.8.8.8", 53), timeout=3)
+
+    def test_not_connected(self, monkeypatch):
+        mock_connect = MagicMock(side_effect=OSError("Network is unreachable"))
+        monkeypatch.setattr(socket, "create_connection", mock_connect)
+        assert not is_internet_connected()
+
+
+@pytest.fixture
+def country_cache_path(tmp_path, mocker):
+    cache_path = tmp_path / "geocache.json"
+    mocker.patch("src.termux_monitor.core._country_cache", None)
+    mocker.patch(
+        "src.termux_monitor.core.GetCountryConfig",
+        GetCountryConfig._replace(CACHE_PATH=cache_path),
+    )
+    return cache_path
+
+
+class TestGetCountry:
+    @pytest.fixture
+    def country_mocks(self, monkeypatch, country_cache_path):
+        mock_get = MagicMock()
+        mock_sleep = MagicMock()
+        monkeypatch.setattr(
+            "src.termux_monitor.core.is_internet_connected", lambda: True
+        )
+        monkeypatch.setattr("src.termux_monitor.core._SESSION.get", mock_get)
+        monkeypatch.setattr(time, "sleep", mock_sleep)
+        return mock_get, mock_sleep
+
+    @pytest.mark.parametrize(
+        "side_effect, content, expected, expected_calls",
+        [
+            (None, b'{"country": "US"}', "US", 1),
+            (Timeout, None, None, _MAX_RETRIES),
+            (RequestException, None, None, 1),
+            (None, b"Invalid JSON", None, 1),
+        ],
+        ids=["success", "timeout", "request_exception", "invalid_json"],
+    )
+    def test_get_country(
+        self, country_mocks, side_effect, content, expected, expected_calls
+    ):
+        mock_get, _ = country_mocks
+        mock_get.side_effect = side_effect
+        mock_get.return_value.content = content
+
+        country = get_country()
+
+        assert country == expected
+        assert mock_get.call_count == expected_calls
+        mock_get.assert_called_with(_URL, timeout=_TIMEOUT)
+
+    @pytest.mark.parametrize(
+        "status_code, expected_calls, expected_sleeps",
+        [
+            (503, _MAX_RETRIES, _MAX_RETRIES),
+            (404, 1, 0),
+        ],
+        ids=["server_error", "client_error"],
+    )
+    def test_get_country_http_error(
+        self, country_mocks, status_code, expected_calls, expected_sleeps
+    ):
+        mock_get, mock_sleep = country_mocks
+        mock_get.return_value.raise_for_status.side_effect = HTTPError(
+            response=MagicMock(status_code=status_code)
+        )
+
+        country = get_country()
+
+        assert country is None
+        assert mock_get.call_count == expected_calls
+        assert mock_sleep.call_count == expected_sleeps
+
+    def test_get_country_uses_cache(self, country_mocks, country_cache_path):
+        mock_get, _ = country_mocks
+        mock_get.return_value.content = b'{"country": "US"}'
+
+        assert get_country() == "US"
+        assert get_country() == "US"
+
+        assert mock_get.call_count == 1
+        cache = json.loads(country_cache_path.read_text())
+        assert cache[_URL]["country"] == "US"
+
+    def test_get_country_expired_cache(self, country_mocks, country_cache_path):
+        mock_get, _ = country_mocks
+        country_cache_path.write_text(json.dumps({_URL: {"country": "IN", "ts": 0}}))
+        mock_get.return_value.content = b'{"country": "US"}'
+
+        country = get_country()
+
+        assert country == "US"
+        assert mock_get.call_count == 1
+
+    def test_get_country_offline_ignores_cache(
+        self, country_mocks, country_cache_path, monkeypatch
+    ):
+        mock_get, _ = country_mocks
+        country_cache_path.write_text(
+            json.dumps({_URL: {"country": "IN", "ts": time.time()}})
+        )
+        monkeypatch.setattr(
+            "src.termux_monitor.core.is_internet_connected", lambda: False
+        )
+
+        assert get_country() is None
+        mock_get.assert_not_called()
+
+    def test_get_country_cache_write_failure_leaves_no_temp_file(
+        self, country_mocks, country_cache_path, monkeypatch
+    ):
+        mock_get, _ = country_mocks
+        mock_get.return_value.content = b'{"country": "US"}'
+        monkeypatch.setattr(os, "replace", MagicMock(side_effect=OSError("boom")))
+
+        assert get_country() == "US"
+
+        assert list(country_cache_path.parent.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            json.dumps({_URL: "IN"}).encode(),
+            json.dumps({_URL: {"country": "IN", "ts": "yesterday"}}).encode(),
+            json.dumps({_URL: {"country": "IN"}}).encode(),
+            b"\xff\xfe\x00garbage",
+        ],
+        ids=["not_a_dict", "non_numeric_ts", "missing_ts", "not_utf8"],
+    )
+    def test_get_country_malformed_cache_entry(
+        self, country_mocks, country_cache_path, contents
+    ):
+        mock_get, _ = country_mocks
+        country_cache_path.write_bytes(contents)
+        mock_get.return_value.content = b'{"country": "US"}'
+
+        country = get_country()
+
+        assert country == "US"
+        assert mock_get.call_count == 1
+
+
+class TestTelephony:
+    def test_get_telephony_device_info_success(self, mock_subprocess_run):
+        mock_subprocess_run.return_value.stdout = _DESIRED_OPERATOR_STDOUT
+        result = get_telephony_device_info()
+        assert result["network_operator_name"] == "Desired Operator"
+
+    def test_get_telephony_device_info_failure(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = _CALLED_PROCESS_ERROR
+        result = get_telephony_device_info()
+        assert result is None
+
+
+class TestGetNotification:
+    example_notification = """[{
+    "id": 6,
+    "tag": "8",
+    "key": "-1|com.android.phone|6|8|1001",
+    "group": "",
+    "packageName": "com.android.phone",
+    "title": "No service",
+    "content": "Selected network (Operator 4G) unavailable",
+    "when": "2024-08-11 08:08:01"
+  }]"""
+    example_notification_stdout = example_notification.encode()
+    example_notification_parsed = json.loads(example_notification)
+
+    def test_successful_execution(self, mock_subprocess_run):
+        mock_subprocess_run.return_value = MagicMock(
+            stdout=TestGetNotification.example_notification_stdout
+        )
+        notifications = get_notifications()
+        assert notifications == TestGetNotification.example_notification_parsed
+
+    def test_failed_execution(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = Exception("Mocked exception")
+        notifications = get_notifications()
+        assert notifications is None
+
+    def test_command_error(self, mock_subprocess_run):
+        mock_subprocess_run.side_effect = _CALLED_PROCESS_ERROR
+        notifications = get_notifications()
+        assert notifications is None
+
+    def test_json_decoding_error(self, mock_subprocess_run):
+        mock_subprocess_run.return_value = MagicMock(stdout=b"Invalid JSON")
+        notifications = get_notifications()
+        assert notifications is None
+
+
+class TestCheckAndRestartWifi:
+    network_down_notification = {
+        "packageName": "com.android.phone",
+        "content": "Selected network (Operator 4G) unavailable",
+    }
+
+    @pytest.fixture
+    def core_mocks(self, mocker):
+        """
+        Patches the device and network calls made by check_and_restart_wifi.
+
+        Returns:
+            tuple: The device info, notifications, get_country and restart_wifi mocks.
+        """
+        return (
+            mocker.patch("src.termux_monitor.core.get_telephony_device_info"),
+            mocker.patch("src.termux_monitor.core.get_notifications", return_value=[]),
+            mocker.patch("src.termux_monitor.core.get_country", return_value="IN"),
+            mocker.patch("src.termux_monitor.core.restart_wifi", return_value=True),
+        )
+
+    def test_no_action_when_network_is_fine(self, core_mocks):
+        mock_device_info, mock_notifications, mock_country, mock_restart = core_mocks
+        mock_device_info.return_value = {
+            "network_operator_name": TelephonyConfig.TARGET_OPERATOR_NAME
+        }
+        assert not check_and_restart_wifi()
+        mock_device_info.assert_called_once()
+        mock_notifications.assert_called_once()
+        mock_country.assert_not_called()
+        mock_restart.assert_not_called()
+
+    def test_no_action_without_notifications(self, core_mocks):
+        mock_device_info, _, mock_country, mock_restart = core_mocks
+        mock_device_info.return_value = {"network_operator_name": "Other"}
+        assert not check_and_restart_wifi()
+        mock_country.assert_not_called()
+        mock_restart.assert_not_called()
+
+    def test_restarts_wifi_when_network_is_down(self, core_mocks):
+        mock_device_info, mock_notifications, mock_country, mock_restart = core_mocks
+        mock_device_info.return_value = {"network_operator_name": "Other"}
+        mock_notifications.return_value = [self.network_down_notification]
+        assert check_and_restart_wifi()
+        mock_country.assert_called_once()
+        mock_restart.assert_called_once()
+
+    def test_offline_with_cached_country_does_not_restart(
+        self, core_mocks, mocker, country_cache_path
+    ):
+        mock_device_info, mock_notifications, mock_country, mock_restart = core_mocks
+        mock_device_info.return_value = {"network_operator_name": "Other"}
+        mock_notifications.return_value = [self.network_down_notification]
+        # Run the real lookup against a fresh cache entry while offline.
+        mock_country.side_effect = get_country
+        country_cache_path.write_text(
+            json.dumps({_URL: {"country": "IN", "ts": time.time()}})
+        )
+        mocker.patch(
+            "src.termux_monitor.core.is_internet_connected", return_value=False
+        )
+
+        assert not check_and_restart_wifi()
+        mock_restart.assert_not_called()
+
+    def test_no_action_without_device_info(self, core_mocks):
+        mock_device_info, _, mock_country, mock_restart = core_mocks
+        mock_device_info.return_value = None
+        assert not check_and_restart_wifi()
+        mock_country.assert_not_called()
+        mock_restart.assert_not_called()
@@ -0,0 +1,48 @@
+import pytest
+
+from src.termux_monitor.config import TelephonyConfig
+from src.termux_monitor.core import (
+    is_network_operator_name_as_desired,
+    is_network_up,
+)
+
+
+class TestIsNetworkOperatorNameAsDesired:
+    def test_is_network_operator_name_as_desired(self):
+        device_info = {"network_operator_name": TelephonyConfig.TARGET_OPERATOR_NAME}
+        result = is_network_operator_name_as_desired(device_info)
+        assert result
+
+    def test_is_network_operator_name_not_as_desired(self):
+        device_info = {"network_operator_name": "Other"}
+        result = is_network_operator_name_as_desired(device_info)
+        assert not result
+
+
+class TestIsNetworkUp:
+    network_down_notification = {
+        "packageName": "com.android.phone",
+        "content": "Selected network (Operator 4G) unavailable",
+    }
+
+    @pytest.mark.parametrize(
+        "notifications, expected",
+        [
+            ([], True),
+            ([{"packageName": "other"}], True),
+            ([{"packageName": "com.android.phone"}], True),
+            ([network_down_notification], False),
+            ([{"packageName": "com.android.phone", "content": "No Service"}], False),
+            ([{"packageName": "other"}, network_down_notification], False),
+        ],
+        ids=[
+            "empty",
+            "no_phone_notifications",
+            "phone_notification_no_content",
+            "phone_notification_network_issues",
+            "phone_notification_no_service_mixed_case",
+            "multiple_notifications_network_issues",
+        ],
+    )
+    def test_is_network_up(self, notifications, expected):
+        assert is_network_up(notifications) is expected
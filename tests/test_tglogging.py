@@ -0,0 +1,116 @@
+import logging
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.termux_monitor.config import LoggingConfig
+from src.termux_monitor.tglogging import (
+    BATCH_SEPARATOR,
+    MAX_MESSAGE_LENGTH,
+    WARNING_EMOJI,
+    TelegramHandler,
+    TelegramQueueHandler,
+)
+
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture
+def queue_handler():
+    with patch(
+        "src.termux_monitor.tglogging.TelegramHandler.send_telegram_message"
+    ) as mock_send:
+        handler = TelegramQueueHandler("token", "chat_id")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        yield handler, mock_send
+        handler.close()
+
+
+def make_record(msg, level=logging.INFO, exc_info=None):
+    return logging.LogRecord("test", level, __file__, 1, msg, None, exc_info)
+
+
+class TestTelegramHandler:
+    def test_prefixes_message_with_level_emoji(self):
+        handler = TelegramHandler("token", "chat_id")
+        assert handler.prefix_message_with_emoji("WARNING", "msg") == (
+            f"{WARNING_EMOJI} msg"
+        )
+        assert handler.prefix_message_with_emoji("CUSTOM", "msg") == " msg"
+
+    def test_uses_module_name_for_module_level_records(self):
+        handler = TelegramHandler("token", "chat_id")
+        handler.setFormatter(logging.Formatter("%(funcName)s"))
+        record = make_record("msg")
+        record.funcName = "<module>"
+        assert handler.format_record(record).endswith(record.module)
+
+    def test_bounds_telegram_request_with_timeout(self):
+        handler = TelegramHandler("token", "chat_id")
+        with patch("src.termux_monitor.tglogging._SESSION.post") as mock_post:
+            handler.send_telegram_message("msg")
+        assert mock_post.call_args.kwargs["timeout"] == LoggingConfig.TELEGRAM_TIMEOUT
+
+
+class TestTelegramQueueHandler:
+    def test_requires_credentials(self):
+        # Holding the exception keeps anything it references alive, as dictConfig's
+        # chained error does; logging.shutdown() then closes every registered handler.
+        with pytest.raises(ValueError) as excinfo:
+            TelegramQueueHandler(None, None)
+        assert excinfo.value
+        for ref in logging._handlerList:
+            handler = ref()
+            if isinstance(handler, TelegramQueueHandler):
+                assert hasattr(handler, "listener")
+
+    def test_sends_message_from_listener(self, queue_handler):
+        handler, mock_send = queue_handler
+        handler.handle(make_record("hello"))
+        handler.close()
+        mock_send.assert_called_once()
+        assert mock_send.call_args[0][0].endswith("hello")
+
+    def test_keeps_exception_text(self, queue_handler):
+        handler, mock_send = queue_handler
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = make_record("failed", logging.ERROR, exc_info=sys.exc_info())
+        handler.handle(record)
+        handler.close()
+        assert "RuntimeError: boom" in mock_send.call_args[0][0]
+
+    def test_sends_lone_record_without_waiting_for_close(self, queue_handler):
+        handler, mock_send = queue_handler
+        handler.handle(make_record("hello"))
+        # queue.join() returns once the listener has called task_done() for the record.
+        joiner = threading.Thread(target=handler.queue.join, daemon=True)
+        joiner.start()
+        joiner.join(timeout=1)
+        assert not joiner.is_alive()
+        mock_send.assert_called_once()
+
+    def test_coalesces_burst_into_one_message(self, queue_handler):
+        handler, mock_send = queue_handler
+        # Queue the burst while the listener is stopped so it is drained as one batch.
+        handler.listener.stop()
+        for i in range(3):
+            handler.handle(make_record(f"record {i}"))
+        handler.listener.start()
+        handler.close()
+        mock_send.assert_called_once()
+        message = mock_send.call_args[0][0]
+        assert message.count(BATCH_SEPARATOR) == 2
+        assert "record 0" in message and "record 2" in message
+
+    def test_splits_batch_at_message_length_limit(self, queue_handler):
+        handler, mock_send = queue_handler
+        for i in range(3):
+            handler.handle(make_record(str(i) * (MAX_MESSAGE_LENGTH // 2)))
+        handler.close()
+        assert mock_send.call_count == 3
+        for call in mock_send.call_args_list:
+            assert BATCH_SEPARATOR not in call[0][0]